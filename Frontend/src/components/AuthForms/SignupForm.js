@@ -6,6 +6,11 @@ import { getAuthErrorMessage } from '../../services/auth';
 import Button from '../Common/Button';
 import '../../styles/App.css';
 
+// Domain labels exclude "." so each dot has exactly one way to match (no backtracking)
+const EMAIL_PATTERN = /^[^\s@]+@[^\s@.]+(?:\.[^\s@.]+)+$/;
+// At least 8 characters, one uppercase, one lowercase, one number
+const PASSWORD_PATTERN = /^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)[a-zA-Z\d]{8,}$/;
+
 const SignupForm = () => {
   const [username, setUsername] = useState('');
   const [email, setEmail] = useState('');
@@ -16,14 +21,17 @@ const SignupForm = () => {
   const navigate = useNavigate();
 
   const validateEmail = (email) => {
-    const re = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-    return re.test(email);
+    // Cheap structural checks first; the regex only runs on plausible addresses
+    if (email.length > 254) return false;
+    const at = email.lastIndexOf('@');
+    if (at < 1 || email.indexOf('.', at) === -1) return false;
+    return EMAIL_PATTERN.test(email);
   };
 
   const validatePassword = (password) => {
-    // At least 8 characters, one uppercase, one lowercase, one number
-    const re = /^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)[a-zA-Z\d]{8,}$/;
-    return re.test(password);
+    // Too short can never match, so skip the three lookahead scans
+    if (password.length < 8) return false;
+    return PASSWORD_PATTERN.test(password);
   };
 
   const handleSubmit = async (e) => {
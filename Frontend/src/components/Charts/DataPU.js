@@ -1,3 +1,17 @@
+// Patterns that name what a score/rating/points value measures, in priority order
+const VALUE_LABEL_PATTERNS = [
+  { pattern: /(?:of|for|in|about)\s+([a-z]+(?:\s+[a-z]+)?)\s+(?:score|rating|points)/i, extract: (match) => match[1] + ' Score' },
+  { pattern: /([a-z]+(?:\s+[a-z]+)?)\s+(?:score|rating|points)/i, extract: (match) => match[1] + ' Score' },
+  { pattern: /(?:score|rating|points)\s+(?:of|for|in)\s+([a-z]+(?:\s+[a-z]+)?)/i, extract: (match) => match[1] + ' Score' },
+];
+
+// "<word> score|rating|points", tried in this order by extractContextBefore
+const CONTEXT_BEFORE_PATTERNS = [
+  /(\w+)\s+score/i,
+  /(\w+)\s+rating/i,
+  /(\w+)\s+points/i,
+];
+
 /**
  * Extract semantic metadata from text (query/response) to determine what values represent
  */
@@ -13,14 +27,8 @@ function extractSemanticMetadata(text, queryText = '') {
   };
   
   // Try to extract what the value represents from the query/response
-  const valuePatterns = [
-    { pattern: /(?:of|for|in|about)\s+([a-z]+(?:\s+[a-z]+)?)\s+(?:score|rating|points)/i, extract: (match) => match[1] + ' Score' },
-    { pattern: /([a-z]+(?:\s+[a-z]+)?)\s+(?:score|rating|points)/i, extract: (match) => match[1] + ' Score' },
-    { pattern: /(?:score|rating|points)\s+(?:of|for|in)\s+([a-z]+(?:\s+[a-z]+)?)/i, extract: (match) => match[1] + ' Score' },
-  ];
-  
   let extractedValueLabel = null;
-  for (const { pattern, extract } of valuePatterns) {
+  for (const { pattern, extract } of VALUE_LABEL_PATTERNS) {
     const match = fullText.match(pattern);
     if (match) {
       extractedValueLabel = extract(match);
@@ -53,7 +61,7 @@ function extractSemanticMetadata(text, queryText = '') {
     if (extractedValueLabel) {
       metadata.valueLabel = extractedValueLabel;
     } else {
-      const scoreContext = extractContextBefore(combinedText, ['score', 'rating', 'points']);
+      const scoreContext = extractContextBefore(combinedText);
       metadata.valueLabel = scoreContext ? `${scoreContext} ${scoreContext.includes('score') ? '' : 'Score'}` : 'Score';
     }
     metadata.yAxisLabel = metadata.valueLabel;
@@ -96,9 +104,8 @@ function extractSemanticMetadata(text, queryText = '') {
 /**
  * Extract context before a keyword (e.g., "performance score" -> "performance")
  */
-function extractContextBefore(text, keywords) {
-  for (const keyword of keywords) {
-    const regex = new RegExp(`(\\w+)\\s+${keyword}`, 'i');
+function extractContextBefore(text) {
+  for (const regex of CONTEXT_BEFORE_PATTERNS) {
     const match = text.match(regex);
     if (match && match[1]) {
       const context = match[1];
@@ -178,7 +185,7 @@ export const processChartData = (data, query) => {
         result.metadata = extractSemanticMetadata(data, queryText);
         return result;
       }
-      const result = processTextData(data);
+      const result = processFlatTextData(data);
       result.metadata = extractSemanticMetadata(data, queryText);
       return result;
     } else if (Array.isArray(data)) {
@@ -1618,6 +1625,39 @@ function processSavedChatData(chatString) {
   }
 }
 
+// Hierarchy keywords
+const HIERARCHY_KEYWORDS = [
+  "structure", "hierarchy", "nested", "parent", "child", "tree", "branch", "root", 
+  "descendant", "ancestor", "organization", "breakdown", "composition", "contains",
+  "hierarchical", "level", "tier", "layer", "subordinate", "superordinate", "category",
+  "subcategory", "classification", "taxonomy", "class", "subclass", "group", "subgroup",
+  "department", "division", "section", "subsection", "part", "subpart", "component",
+  "subcomponent", "element", "subelement", "unit", "subunit", "module", "submodule"
+];
+// One alternation scans the text once instead of once per keyword. "sub" also
+// covers the parent/child/subsidiary/division/department relationship check,
+// whose other terms are already keywords.
+const HIERARCHY_KEYWORD_PATTERN = new RegExp(HIERARCHY_KEYWORDS.concat('sub').join('|'));
+
+// Line-structure cues for hierarchical text, joined into one pattern so the text
+// is scanned once
+const HIERARCHY_STRUCTURE_PATTERN = new RegExp([
+  // Bullet points with hierarchy indicators (*, +, -, etc.)
+  /^\s*[\*\+\-]\s+/,
+  // Numbered lists
+  /^\s*\d+\.\s+/,
+  // Indentation patterns
+  /^\s{2,}[^\s]/,
+  // Common hierarchical separators
+  /[:\-]\s*\n\s*[\*\+\-]/,
+  // Repeated patterns that suggest hierarchy
+  /(?:^|\n)(?:\s*[\*\+\-]|\s*\d+\.|\s*[A-Z]\.|\s*[a-z]\.|\s*[IVX]+\.|\s*[ivx]+\.)/,
+  // Nested bullet points
+  /^\s*[\*\+\-]\s+.*\n\s{2,}[\*\+\-]/,
+  // Numbered sub-items
+  /^\s*\d+\.\s+.*\n\s{2,}\d+\./
+].map(pattern => pattern.source).join('|'), 'm');
+
 /**
  * Helper function to detect hierarchical data structures in text
  */
@@ -1625,49 +1665,30 @@ function containsHierarchicalData(text) {
   // Convert text to lowercase for case-insensitive matching
   const lowerText = text.toLowerCase();
   
-  // Hierarchy keywords
-  const hierarchy_keywords = [
-    "structure", "hierarchy", "nested", "parent", "child", "tree", "branch", "root", 
-    "descendant", "ancestor", "organization", "breakdown", "composition", "contains",
-    "hierarchical", "level", "tier", "layer", "subordinate", "superordinate", "category",
-    "subcategory", "classification", "taxonomy", "class", "subclass", "group", "subgroup",
-    "department", "division", "section", "subsection", "part", "subpart", "component",
-    "subcomponent", "element", "subelement", "unit", "subunit", "module", "submodule"
-  ];
-  
   // Check if text contains any of the hierarchy keywords
-  const hasHierarchyKeyword = hierarchy_keywords.some(keyword => lowerText.includes(keyword));
-  
-  // Check for common hierarchical patterns
-  const hasHierarchicalPatterns = (
-    // Look for nested structures with asterisks
-    (text.includes('**') && text.includes(':')) || 
-    // Look for bullet points with hierarchy indicators (*, +, -, etc.)
-    /^\s*[\*\+\-]\s+/m.test(text) ||
-    // Look for numbered lists
-    /^\s*\d+\.\s+/m.test(text) ||
-    // Look for indentation patterns
-    /^\s{2,}[^\s]/m.test(text) ||
-    // Look for common hierarchical separators
-    /[:\-]\s*\n\s*[\*\+\-]/m.test(text) ||
-    // Look for parent-child relationships
-    /(?:parent|child|children|sub|subsidiary|division|department)/i.test(text)
-  );
+  const hasHierarchyKeyword = HIERARCHY_KEYWORD_PATTERN.test(lowerText);
   
-  // Check for data that looks like a hierarchy
-  const hasHierarchicalStructure = (
-    // Check for repeated patterns that suggest hierarchy
-    /(?:^|\n)(?:\s*[\*\+\-]|\s*\d+\.|\s*[A-Z]\.|\s*[a-z]\.|\s*[IVX]+\.|\s*[ivx]+\.)/m.test(text) ||
-    // Check for nested bullet points
-    /^\s*[\*\+\-]\s+.*\n\s{2,}[\*\+\-]/m.test(text) ||
-    // Check for numbered sub-items
-    /^\s*\d+\.\s+.*\n\s{2,}\d+\./m.test(text)
-  );
+  // Look for nested structures with asterisks
+  const hasAsteriskSections = text.includes('**') && text.includes(':');
   
-  return hasHierarchyKeyword || hasHierarchicalPatterns || hasHierarchicalStructure;
+  return hasHierarchyKeyword || hasAsteriskSections || HIERARCHY_STRUCTURE_PATTERN.test(text);
 }
 
 function extractEnhancedHierarchicalData(text) {
+  // Special-cased structures have their own parsers; check for them before
+  // walking the lines so the generic pass isn't built and then thrown away
+  const lowerText = text.toLowerCase();
+  
+  // Special processing for film studios structure
+  if (lowerText.includes("studios") && lowerText.includes("subsidiaries")) {
+    return processStudioStructure(text);
+  }
+  
+  // Special processing for dramatic structure
+  if (lowerText.includes("dramatic structure") || lowerText.includes("act 1")) {
+    return processDramaticStructure(text);
+  }
+  
   const result = {
     name: detectTitleFromText(text) || "Hierarchical Data",
     children: []
@@ -1689,8 +1710,8 @@ function extractEnhancedHierarchicalData(text) {
     // Detect hierarchical elements and their levels
     
     // Major section headers (often bold with **)
-    if (line.match(/^\*\*([^*:]+)(?:\*\*|:)/)) {
-      const sectionMatch = line.match(/^\*\*([^*:]+)(?:\*\*|:)/);
+    const sectionMatch = line.match(/^\*\*([^*:]+)(?:\*\*|:)/);
+    if (sectionMatch) {
       const sectionName = sectionMatch[1].trim();
       
       const newSection = {
@@ -1710,8 +1731,8 @@ function extractEnhancedHierarchicalData(text) {
     }
     
     // Numbered items (1., 2., etc)
-    if (line.match(/^\*?\s*\d+\.\s*\*?\*([^*:]+)(?:\*\*|:)/)) {
-      const itemMatch = line.match(/^\*?\s*\d+\.\s*\*?\*([^*:]+)(?:\*\*|:)/);
+    const itemMatch = line.match(/^\*?\s*\d+\.\s*\*?\*([^*:]+)(?:\*\*|:)/);
+    if (itemMatch) {
       const itemName = itemMatch[1].trim();
       
       // This is typically a second level item
@@ -1755,8 +1776,8 @@ function extractEnhancedHierarchicalData(text) {
     }
     
     // Bullet points (*, -, +) that contain examples or further details
-    if (line.match(/^\s*[\*\-\+]\s+(.+)/)) {
-      const bulletMatch = line.match(/^\s*[\*\-\+]\s+(.+)/);
+    const bulletMatch = line.match(/^\s*[\*\-\+]\s+(.+)/);
+    if (bulletMatch) {
       let itemText = bulletMatch[1].trim();
       
       // Extract example names if present
@@ -1806,8 +1827,8 @@ function extractEnhancedHierarchicalData(text) {
     }
     
     // Sequences with plus signs (+)
-    if (line.match(/^\s*\+\s+(.+)/)) {
-      const plusMatch = line.match(/^\s*\+\s+(.+)/);
+    const plusMatch = line.match(/^\s*\+\s+(.+)/);
+    if (plusMatch) {
       const itemName = plusMatch[1].trim();
       
       // This is typically a detail item
@@ -1831,16 +1852,6 @@ function extractEnhancedHierarchicalData(text) {
     }
   }
   
-  // Special processing for film studios structure
-  if (text.toLowerCase().includes("studios") && text.toLowerCase().includes("subsidiaries")) {
-    return processStudioStructure(text);
-  }
-  
-  // Special processing for dramatic structure
-  if (text.toLowerCase().includes("dramatic structure") || text.toLowerCase().includes("act 1")) {
-    return processDramaticStructure(text);
-  }
-  
   return result;
 }
 
@@ -1867,8 +1878,8 @@ function processStudioStructure(text) {
     if (!line) continue;
     
     // Match main studio category (Big Six, Independent majors, etc.)
-    if (line.match(/\*\*([^*]+):\*\*/)) {
-      const categoryMatch = line.match(/\*\*([^*]+):\*\*/);
+    const categoryMatch = line.match(/\*\*([^*]+):\*\*/);
+    if (categoryMatch) {
       currentCategory = {
         name: categoryMatch[1].trim(),
         value: 100,
@@ -1879,8 +1890,8 @@ function processStudioStructure(text) {
     }
     
     // Match numbered studio entries (1. Studio Name)
-    if (line.match(/^\d+\.\s+\*\*([^*]+)\*\*/)) {
-      const studioMatch = line.match(/^\d+\.\s+\*\*([^*]+)\*\*/);
+    const studioMatch = line.match(/^\d+\.\s+\*\*([^*]+)\*\*/);
+    if (studioMatch) {
       let studioName = studioMatch[1].trim();
       
       // Extract ownership info if present
@@ -1908,8 +1919,8 @@ function processStudioStructure(text) {
     }
     
     // Match subsidiary entries (* Subsidiary Name)
-    if (line.match(/^\s*\*\s+([^*]+)/)) {
-      const subsidiaryMatch = line.match(/^\s*\*\s+([^*]+)/);
+    const subsidiaryMatch = line.match(/^\s*\*\s+([^*]+)/);
+    if (subsidiaryMatch) {
       const subsidiaryName = subsidiaryMatch[1].trim();
       
       const subsidiary = {
@@ -1953,8 +1964,8 @@ function processDramaticStructure(text) {
     if (!line) continue;
     
     // Match act entries (Act 1: Setup)
-    if (line.match(/^Act\s+\d+:\s+(.+)/i)) {
-      const actMatch = line.match(/^Act\s+\d+:\s+(.+)/i);
+    const actMatch = line.match(/^Act\s+\d+:\s+(.+)/i);
+    if (actMatch) {
       const actName = `Act ${line.match(/\d+/)[0]}: ${actMatch[1].trim()}`;
       
       currentAct = {
@@ -2002,8 +2013,8 @@ function processDramaticStructure(text) {
     }
     
     // Match elements with plus signs (+)
-    if (line.match(/^\+\s+(.+)/)) {
-      const elementMatch = line.match(/^\+\s+(.+)/);
+    const elementMatch = line.match(/^\+\s+(.+)/);
+    if (elementMatch) {
       const elementName = elementMatch[1].trim();
       
       const element = {
@@ -2057,12 +2068,13 @@ function processDramaticStructure(text) {
  */
 function detectTitleFromText(text) {
   // Look for common domain identifiers
-  if (text.toLowerCase().includes("film") || text.toLowerCase().includes("cinema") || 
-      text.toLowerCase().includes("movie")) {
+  const lowerText = text.toLowerCase();
+  if (lowerText.includes("film") || lowerText.includes("cinema") || 
+      lowerText.includes("movie")) {
     return "Film Industry Hierarchy";
-  } else if (text.toLowerCase().includes("studio") || text.toLowerCase().includes("organizational structure")) {
+  } else if (lowerText.includes("studio") || lowerText.includes("organizational structure")) {
     return "Hollywood Studio Structure";
-  } else if (text.toLowerCase().includes("dramatic structure") || text.toLowerCase().includes("storytelling")) {
+  } else if (lowerText.includes("dramatic structure") || lowerText.includes("storytelling")) {
     return "Dramatic Structure Hierarchy";
   }
   
@@ -2116,10 +2128,8 @@ function flattenHierarchy(node, result = [], level = 0, parentPath = '') {
  */
 function processMarkdownData(markdown) {
   try {
-    // Basic markdown parsing (simplified without using external library)
-    if (containsHierarchicalData(markdown)) {
-      return enhancedExtractHierarchicalData(markdown);
-    }
+    // Basic markdown parsing (simplified without using external library).
+    // The caller has already ruled out hierarchical data for this text.
     // Remove bold markers
     let plainText = markdown.replace(/\*\*(.*?)\*\*/g, '$1');
     // Remove italic markers
@@ -2165,7 +2175,15 @@ function processMarkdownData(markdown) {
   function processTextData(text) {
     if (containsHierarchicalData(text)) {
       return enhancedExtractHierarchicalData(text);
-    } else if (containsCurrencyData(text)) {
+    }
+    return processFlatTextData(text);
+  }
+  
+  /**
+   * Process text already known not to be hierarchical
+   */
+  function processFlatTextData(text) {
+    if (containsCurrencyData(text)) {
       return extractCurrencyData(text);
     } else if (containsTimeData(text)) {
       return extractTimeData(text);
@@ -2273,27 +2291,39 @@ function processMarkdownData(markdown) {
     return generateSampleData('No usable data in object');
   }
   
+  // Compiled into one case-insensitive alternation so a single scan answers the
+  // check. The entries that used to be case-sensitive contain no letters, so
+  // the shared i flag doesn't change what they match.
+  const CURRENCY_PATTERN = new RegExp([
+    /USD|EUR|GBP|JPY|CAD/,
+    /\$\s*\d+/,
+    /\d+\s*\$/,
+    /€\s*\d+/,
+    /\d+\s*€/,
+    /£\s*\d+/,
+    /\d+\s*£/,
+    /¥\s*\d+/,
+    /\d+\s*¥/,
+    /exchange rate/,
+    /currency/
+  ].map(pattern => pattern.source).join('|'), 'i');
+
   /**
    * Check if the text contains currency data
    */
   function containsCurrencyData(text) {
-    const currencyPatterns = [
-      /USD|EUR|GBP|JPY|CAD/i,
-      /\$\s*\d+/,
-      /\d+\s*\$/,
-      /€\s*\d+/,
-      /\d+\s*€/,
-      /£\s*\d+/,
-      /\d+\s*£/,
-      /¥\s*\d+/,
-      /\d+\s*¥/,
-      /exchange rate/i,
-      /currency/i
-    ];
-    
-    return currencyPatterns.some(pattern => pattern.test(text));
+    return CURRENCY_PATTERN.test(text);
   }
   
+  // "<Month> ...: 1 USD = X <currency>" patterns for the month/currency special case
+  const USD_MONTH_RATE_PATTERNS = ['January', 'July'].flatMap(month =>
+    ['EUR', 'CAD', 'JPY'].map(currency => ({
+      month,
+      currency,
+      pattern: new RegExp(`${month}[^:]*?:.*?USD\\s*=\\s*([0-9.]+)\\s*${currency}`, 'i')
+    }))
+  );
+
   /**
    * Extract currency data from text
    */
@@ -2370,23 +2400,17 @@ function processMarkdownData(markdown) {
         (text.includes('EUR') || text.includes('CAD') || text.includes('JPY'))) {
       
       // Try to match patterns like "January 2023: 1 USD = 0.95 EUR, 1.12 CAD, 120 JPY"
-      const months = ['January', 'July'];
-      const currencies = ['EUR', 'CAD', 'JPY'];
-      
-      months.forEach(month => {
-        currencies.forEach(currency => {
-          const pattern = new RegExp(`${month}[^:]*?:.*?USD\\s*=\\s*([0-9.]+)\\s*${currency}`, 'i');
-          const match = text.match(pattern);
-          
-          if (match) {
-            results.push({
-              name: `${month} USD-${currency}`,
-              value: parseFloat(match[1]),
-              month,
-              currency
-            });
-          }
-        });
+      USD_MONTH_RATE_PATTERNS.forEach(({ month, currency, pattern }) => {
+        const match = text.match(pattern);
+        
+        if (match) {
+          results.push({
+            name: `${month} USD-${currency}`,
+            value: parseFloat(match[1]),
+            month,
+            currency
+          });
+        }
       });
       
       if (results.length > 0) {
@@ -2401,23 +2425,40 @@ function processMarkdownData(markdown) {
     };
   }
   
+  // One alternation, as with CURRENCY_PATTERN
+  const TIME_PATTERN = new RegExp([
+    /January|February|March|April|May|June|July|August|September|October|November|December/,
+    /Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec/,
+    /\b20\d\d\b/,  // Years like 2023
+    /\b\d{1,2}\/\d{1,2}\/\d{2,4}\b/,  // Dates like 01/31/2023
+    /\b\d{4}-\d{2}-\d{2}\b/,  // ISO dates like 2023-01-31
+    /\bQ[1-4]\b/,  // Quarters like Q1, Q2
+    /\bquarter \d\b/  // "Quarter 1"
+  ].map(pattern => pattern.source).join('|'), 'i');
+
   /**
    * Check if the text contains time-based data
    */
   function containsTimeData(text) {
-    const timePatterns = [
-      /January|February|March|April|May|June|July|August|September|October|November|December/i,
-      /Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec/i,
-      /\b20\d\d\b/,  // Years like 2023
-      /\b\d{1,2}\/\d{1,2}\/\d{2,4}\b/,  // Dates like 01/31/2023
-      /\b\d{4}-\d{2}-\d{2}\b/,  // ISO dates like 2023-01-31
-      /\bQ[1-4]\b/i,  // Quarters like Q1, Q2
-      /\bquarter \d\b/i  // "Quarter 1"
-    ];
-    
-    return timePatterns.some(pattern => pattern.test(text));
+    return TIME_PATTERN.test(text);
   }
   
+  // Map for month ordering
+  const MONTH_ORDER = {
+    'january': 1, 'jan': 1,
+    'february': 2, 'feb': 2,
+    'march': 3, 'mar': 3, 
+    'april': 4, 'apr': 4,
+    'may': 5,
+    'june': 6, 'jun': 6,
+    'july': 7, 'jul': 7,
+    'august': 8, 'aug': 8,
+    'september': 9, 'sep': 9,
+    'october': 10, 'oct': 10,
+    'november': 11, 'nov': 11,
+    'december': 12, 'dec': 12
+  };
+
   /**
    * Extract time-based data from text
    */
@@ -2425,22 +2466,6 @@ function processMarkdownData(markdown) {
     const results = [];
     let title = 'Time Series Data';
     
-    // Map for month ordering
-    const monthOrder = {
-      'january': 1, 'jan': 1,
-      'february': 2, 'feb': 2,
-      'march': 3, 'mar': 3, 
-      'april': 4, 'apr': 4,
-      'may': 5,
-      'june': 6, 'jun': 6,
-      'july': 7, 'jul': 7,
-      'august': 8, 'aug': 8,
-      'september': 9, 'sep': 9,
-      'october': 10, 'oct': 10,
-      'november': 11, 'nov': 11,
-      'december': 12, 'dec': 12
-    };
-    
     // Extract month-based data
     const monthPattern = /(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[^:]*?:\s*([0-9.]+)/gi;
     
@@ -2451,20 +2476,14 @@ function processMarkdownData(markdown) {
       
       if (!isNaN(value)) {
         // Get the standardized month name and order
+        // monthPattern only captures full names or three-letter abbreviations,
+        // all of which are MONTH_ORDER keys, so a direct lookup suffices
         const monthLower = month.toLowerCase();
-        let monthName = month;
-        let order = 0;
-        
-        for (const [key, val] of Object.entries(monthOrder)) {
-          if (monthLower.startsWith(key)) {
-            order = val;
-            // Convert abbreviations to full month names if needed
-            if (month.length <= 3) {
-              monthName = key.charAt(0).toUpperCase() + key.slice(1);
-            }
-            break;
-          }
-        }
+        const order = MONTH_ORDER[monthLower] || 0;
+        // Normalise the casing of abbreviations
+        const monthName = month.length <= 3
+          ? monthLower.charAt(0).toUpperCase() + monthLower.slice(1)
+          : month;
         
         results.push({
           name: monthName,
@@ -2480,11 +2499,12 @@ function processMarkdownData(markdown) {
       title = 'Monthly Data';
       
       // Try to determine what kind of monthly data this is
-      if (text.toLowerCase().includes('temperature') || text.toLowerCase().includes('weather')) {
+      const lowerText = text.toLowerCase();
+      if (lowerText.includes('temperature') || lowerText.includes('weather')) {
         title = 'Monthly Temperature Data';
-      } else if (text.toLowerCase().includes('sales') || text.toLowerCase().includes('revenue')) {
+      } else if (lowerText.includes('sales') || lowerText.includes('revenue')) {
         title = 'Monthly Sales Data';
-      } else if (text.toLowerCase().includes('growth') || text.toLowerCase().includes('gdp')) {
+      } else if (lowerText.includes('growth') || lowerText.includes('gdp')) {
         title = 'Monthly Growth Data';
       }
       
@@ -2600,11 +2620,12 @@ function processMarkdownData(markdown) {
     
     // Determine an appropriate title
     let title = 'Percentage Data';
-    if (text.toLowerCase().includes('market') && text.toLowerCase().includes('share')) {
+    const lowerText = text.toLowerCase();
+    if (lowerText.includes('market') && lowerText.includes('share')) {
       title = 'Market Share';
-    } else if (text.toLowerCase().includes('growth')) {
+    } else if (lowerText.includes('growth')) {
       title = 'Growth Percentages';
-    } else if (text.toLowerCase().includes('distribution')) {
+    } else if (lowerText.includes('distribution')) {
       title = 'Distribution Percentages';
     }
     
@@ -2622,6 +2643,12 @@ function processMarkdownData(markdown) {
     return /^[ \t]*[-•*+][ \t]/m.test(text) || /^[ \t]*\d+\.[ \t]/m.test(text);
   }
   
+  // Patterns for different types of bullet points
+  const BULLET_VALUE_PATTERNS = [
+    /^[ \t]*[-•*+][ \t]+(.*?):\s*(\d+(?:\.\d+)?)/,  // - Term: 123
+    /^[ \t]*\d+\.[ \t]+(.*?):\s*(\d+(?:\.\d+)?)/    // 1. Term: 123
+  ];
+
   /**
    * Extract data from bullet points
    */
@@ -2631,14 +2658,8 @@ function processMarkdownData(markdown) {
     // Split text into lines
     const lines = text.split('\n');
     
-    // Patterns for different types of bullet points
-    const bulletPatterns = [
-      /^[ \t]*[-•*+][ \t]+(.*?):\s*(\d+(?:\.\d+)?)/,  // - Term: 123
-      /^[ \t]*\d+\.[ \t]+(.*?):\s*(\d+(?:\.\d+)?)/    // 1. Term: 123
-    ];
-    
     for (const line of lines) {
-      for (const pattern of bulletPatterns) {
+      for (const pattern of BULLET_VALUE_PATTERNS) {
         const match = line.match(pattern);
         if (match) {
           const term = match[1].trim();
@@ -2714,19 +2735,20 @@ function processMarkdownData(markdown) {
     return generateSampleData('No data patterns found in text');
   }
   
+  const WORD_TO_NUMBER = {
+    'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
+    'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
+    'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20,
+    'thirty': 30, 'forty': 40, 'fifty': 50, 'sixty': 60, 'seventy': 70,
+    'eighty': 80, 'ninety': 90
+  };
+
   /**
    * Extract numbers written as words (e.g., "twenty-five")
    */
   function extractWordNumbers(text) {
     const results = [];
-    const wordToNumber = {
-      'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-      'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
-      'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
-      'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20,
-      'thirty': 30, 'forty': 40, 'fifty': 50, 'sixty': 60, 'seventy': 70,
-      'eighty': 80, 'ninety': 90
-    };
     
     // Pattern for "Term: twenty-five" or "Term: twenty five"
     const wordNumberPattern = /([^:\n]+):\s*((?:one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety)(?:[-\s](?:one|two|three|four|five|six|seven|eight|nine))?)/gi;
@@ -2740,11 +2762,11 @@ function processMarkdownData(markdown) {
       let value = 0;
       if (numberWord.includes('-') || numberWord.includes(' ')) {
         const parts = numberWord.split(/[-\s]+/);
-        if (parts.length === 2 && wordToNumber[parts[0]] !== undefined && wordToNumber[parts[1]] !== undefined) {
-          value = wordToNumber[parts[0]] + wordToNumber[parts[1]];
+        if (parts.length === 2 && WORD_TO_NUMBER[parts[0]] !== undefined && WORD_TO_NUMBER[parts[1]] !== undefined) {
+          value = WORD_TO_NUMBER[parts[0]] + WORD_TO_NUMBER[parts[1]];
         }
-      } else if (wordToNumber[numberWord] !== undefined) {
-        value = wordToNumber[numberWord];
+      } else if (WORD_TO_NUMBER[numberWord] !== undefined) {
+        value = WORD_TO_NUMBER[numberWord];
       }
       
       if (value > 0) {
@@ -2,6 +2,18 @@ import React, { useState, useRef, useCallback, useEffect } from 'react';
 // Selection-only; processing happens on Send via uploadAndAnalyze
 import '../../styles/file-upload.css';
 
+// Matches the backend's MAX_FILE_SIZE; larger files are rejected before upload
+const MAX_FILE_SIZE = 10 * 1024 * 1024;
+const MAX_FILE_SIZE_MB = MAX_FILE_SIZE / (1024 * 1024);
+// Dropped files bypass the input's accept filter, so check suffixes ourselves
+const ALLOWED_EXTENSIONS = ['.pdf', '.docx', '.txt', '.csv'];
+const ALLOWED_EXTENSION_SET = new Set(ALLOWED_EXTENSIONS);
+
+const isAllowedFile = (name) => {
+  const dot = name.lastIndexOf('.');
+  return dot !== -1 && ALLOWED_EXTENSION_SET.has(name.slice(dot).toLowerCase());
+};
+
 const FileUpload = ({ onFileUpload }) => {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
@@ -13,17 +25,37 @@ const FileUpload = ({ onFileUpload }) => {
     onFileUpload(files);
   }, [files, onFileUpload]);
 
+  // Filter unsupported or oversized files before they are buffered into the upload
+  const addFiles = useCallback((incoming) => {
+    const typed = incoming.filter((f) => isAllowedFile(f.name));
+    const accepted = typed.filter((f) => f.size <= MAX_FILE_SIZE);
+    const badType = incoming.length - typed.length;
+    const tooLarge = typed.length - accepted.length;
+    // A single drop can hit both filters, so report every reason a file was skipped
+    const problems = [];
+    if (badType) {
+      problems.push(`${badType} file${badType > 1 ? 's' : ''} skipped: only ${ALLOWED_EXTENSIONS.join(', ')} files are supported`);
+    }
+    if (tooLarge) {
+      problems.push(`${tooLarge} file${tooLarge > 1 ? 's' : ''} exceeded the ${MAX_FILE_SIZE_MB} MB limit`);
+    }
+    setError(problems.join('; '));
+    if (accepted.length) {
+      setFiles((prev) => [...prev, ...accepted]);
+    }
+  }, []);
+
   const handleFileChange = async (e) => {
     const selectedFiles = Array.from(e.target.files || []);
     if (!selectedFiles.length) return;
     
-    setFiles((prev) => [...prev, ...selectedFiles]);
-    setError('');
+    addFiles(selectedFiles);
     // Do not auto-upload; user will click Send
   };
 
   const clearSelection = () => {
     setFiles([]);
+    setError('');
     if (fileInputRef.current) fileInputRef.current.value = '';
   };
 
@@ -36,9 +68,9 @@ const FileUpload = ({ onFileUpload }) => {
     if (loading) return;
     const droppedFiles = Array.from(e.dataTransfer.files || []);
     if (droppedFiles.length) {
-      setFiles((prev) => [...prev, ...droppedFiles]);
+      addFiles(droppedFiles);
     }
-  }, [loading]);
+  }, [loading, addFiles]);
 
   const onDragOver = (e) => {
     e.preventDefault();
@@ -57,7 +89,7 @@ const FileUpload = ({ onFileUpload }) => {
         ref={fileInputRef}
         type="file"
         onChange={handleFileChange}
-        accept=".pdf,.docx,.txt,.csv"
+        accept={ALLOWED_EXTENSIONS.join(',')}
         multiple
         style={{ display: 'none' }}
         id="file-upload"
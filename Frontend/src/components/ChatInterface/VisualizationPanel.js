@@ -1,5 +1,5 @@
 // src/components/ChatInterface/VisualizationPanel.js
-import React, { useState, lazy, Suspense } from 'react';
+import React, { useState, useMemo, lazy, Suspense } from 'react';
 import '../../styles/App.css';
 import { processChartData } from '../Charts/DataPU';
 import { downloadSvgChartAsPng } from '../../utils/downloadChartAsPng';
@@ -51,6 +51,59 @@ const CHART_DESCRIPTIONS = {
   word_cloud: 'Word cloud: Visualizes word frequency.'
 };
 
+// Emoji icon map (placeholder, can be replaced with SVGs)
+const CHART_ICONS = {
+  area_chart: '📈',
+  bar_chart: '📊',
+  line_chart: '📉',
+  donut_chart: '🍩',
+  stacked_area_chart: '🌈',
+  chord_diagram: '🕸️',
+  heatmap_chart: '🔥',
+  treemap_chart: '🗺️',
+  circle_packing: '⚪',
+  sunburst_chart: '🌞',
+  connection_map: '🧭',
+  DAG: '🔗',
+  mosaic_plot: '🧩',
+  network_graph: '🌐',
+  polar_area: '🧊',
+  small_multiples: '🖼️',
+  tree_diagram: '🌳',
+  voronoi_map: '🗺️',
+  word_cloud: '☁️'
+};
+
+// Chart tiers are fixed, so the lookup sets are built once rather than per render.
+// Define which visualizations are premium
+const PREMIUM_VISUALIZATIONS = new Set([
+  'chord_diagram',
+  'circle_packing',
+  'connection_map',
+  'DAG',
+  'heatmap_chart',
+  'mosaic_plot',
+  'network_graph',
+  'polar_area',
+  'small_multiples',
+  'sunburst_chart',
+  'tree_diagram',
+  'treemap_chart',
+  'voronoi_map'
+]);
+
+// Charts available to non-premium users
+const SIMPLE_VISUALIZATIONS = new Set(['area_chart', 'bar_chart', 'line_chart', 'stacked_area_chart', 'donut_chart', 'word_cloud']);
+
+// Define which charts expect hierarchical data structure
+const HIERARCHICAL_CHARTS = new Set([
+  'treemap_chart',
+  'circle_packing',
+  'sunburst_chart',
+  'tree_diagram',
+  'DAG'
+]);
+
 const VisualizationPanel = ({
   visualizationData,
   visualizationOptions,
@@ -60,47 +113,19 @@ const VisualizationPanel = ({
 }) => {
   const { query, response } = visualizationData || {};
   
-  // Define which visualizations are premium
-  const premiumVisualizations = [
-    'chord_diagram',
-    'circle_packing',
-    'connection_map',
-    'DAG',
-    'heatmap_chart',
-    'mosaic_plot',
-    'network_graph',
-    'polar_area',
-    'small_multiples',
-    'sunburst_chart',
-    'tree_diagram',
-    'treemap_chart',
-    'voronoi_map'
-  ];
-  
-  // Use simpleVisualizations to determine which charts are available to non-premium users
-  const simpleVisualizations = ['area_chart', 'bar_chart', 'line_chart', 'stacked_area_chart', 'donut_chart', 'word_cloud'];
-
-  // Define which charts expect hierarchical data structure
-  const hierarchicalCharts = [
-    'treemap_chart',
-    'circle_packing',
-    'sunburst_chart',
-    'tree_diagram',
-    'DAG'
-  ];
-  
   const [isLoading, setIsLoading] = useState(false);
   const [downloadMsg, setDownloadMsg] = useState("");
   const [showInfo, setShowInfo] = useState(false);
+
+  // Parsing depends only on the response/query pair, so do it once per pair
+  // rather than on every render and chart switch
+  const processedData = useMemo(() => processChartData(response, query), [response, query]);
   
-  // Function to safely process and format chart data
-  const getChartData = (data, query, chartType) => {
+  // Function to safely format the processed data for a chart type
+  const getChartData = (result, chartType) => {
     try {
-      // Process the data/query using the existing function
-      const result = processChartData(data, query);
-      
       // Check if this chart expects hierarchical data
-      const expectsHierarchical = hierarchicalCharts.includes(chartType);
+      const expectsHierarchical = HIERARCHICAL_CHARTS.has(chartType);
       
       // Check what format we got from the processing
       const isHierarchical = result.isHierarchical && result.data && result.data.children;
@@ -125,7 +150,7 @@ const VisualizationPanel = ({
       return expectsHierarchical ? createDefaultHierarchicalData() : createDefaultArrayData();
     } catch (error) {
       console.error(`Error processing data for ${chartType}:`, error);
-      return hierarchicalCharts.includes(chartType) ? 
+      return HIERARCHICAL_CHARTS.has(chartType) ? 
         createDefaultHierarchicalData() : 
         createDefaultArrayData();
     }
@@ -227,7 +252,7 @@ const VisualizationPanel = ({
       return <div className="visualization-loading"><div className="spinner" /> Loading chart...</div>;
     }
     // Process the data for this chart type
-    const chartData = getChartData(response, query, selectedChart);
+    const chartData = getChartData(processedData, selectedChart);
     try {
       const chartComponent = (() => {
       switch (selectedChart) {
@@ -240,8 +265,7 @@ const VisualizationPanel = ({
         case 'donut_chart':
             return <DonutChart data={chartData} query={query} />;
         case 'stacked_area_chart':
-            const result = processChartData(response, query);
-            return <StackedArea data={result.data} categories={result.categories} query={query} />;
+            return <StackedArea data={processedData.data} categories={processedData.categories} query={query} />;
         case 'chord_diagram':
             return <ChordDiagram data={chartData} query={query} />;
         case 'heatmap_chart':
@@ -342,31 +366,9 @@ const VisualizationPanel = ({
           <h4>Chart Types</h4>
           <div className="chart-type-list">
             {visualizationOptions.map(([chart, score]) => {
-              const isPremiumChart = premiumVisualizations.includes(chart);
-              const isSimpleChart = simpleVisualizations.includes(chart);
+              const isPremiumChart = PREMIUM_VISUALIZATIONS.has(chart);
+              const isSimpleChart = SIMPLE_VISUALIZATIONS.has(chart);
               const isDisabled = isPremiumChart && !isSimpleChart && !isPremium;
-              // Emoji icon map (placeholder, can be replaced with SVGs)
-              const chartIcons = {
-                area_chart: '📈',
-                bar_chart: '📊',
-                line_chart: '📉',
-                donut_chart: '🍩',
-                stacked_area_chart: '🌈',
-                chord_diagram: '🕸️',
-                heatmap_chart: '🔥',
-                treemap_chart: '🗺️',
-                circle_packing: '⚪',
-                sunburst_chart: '🌞',
-                connection_map: '🧭',
-                DAG: '🔗',
-                mosaic_plot: '🧩',
-                network_graph: '🌐',
-                polar_area: '🧊',
-                small_multiples: '🖼️',
-                tree_diagram: '🌳',
-                voronoi_map: '🗺️',
-                word_cloud: '☁️'
-              };
               return (
                 <div
                   key={chart}
@@ -385,7 +387,7 @@ const VisualizationPanel = ({
                     display: 'flex', alignItems: 'center', gap: 8, padding: 8, borderRadius: 6, marginBottom: 6
                   }}
                 >
-                  <span className="chart-icon" style={{ fontSize: 22 }}>{chartIcons[chart] || '📊'}</span>
+                  <span className="chart-icon" style={{ fontSize: 22 }}>{CHART_ICONS[chart] || '📊'}</span>
                   <span className="chart-name">{chart.replace(/_/g, ' ')}{isPremiumChart && <span className="premium-icon">✨</span>}</span>
                   <span className="info-tooltip custom-tooltip" style={{ marginLeft: 4, color: '#888', cursor: 'help', position: 'relative' }}>
                     ℹ️
@@ -0,0 +1,46 @@
+import React from 'react';
+import { render, screen, fireEvent } from '@testing-library/react';
+import '@testing-library/jest-dom';
+import FileUpload from '../FileUpload';
+
+describe('FileUpload Component', () => {
+  const makeFile = (name, size) => {
+    const file = new File(['x'], name);
+    // Fake the size so the test doesn't allocate the whole payload
+    Object.defineProperty(file, 'size', { value: size });
+    return file;
+  };
+
+  const dropFiles = (files) => {
+    fireEvent.drop(screen.getByRole('button', { name: /drag and drop/i }), {
+      dataTransfer: { files },
+    });
+  };
+
+  test('keeps supported files and reports every rejected one', () => {
+    const onFileUpload = jest.fn();
+    render(<FileUpload onFileUpload={onFileUpload} />);
+
+    dropFiles([
+      makeFile('a.PDF', 1024),
+      makeFile('b.exe', 1024),
+      makeFile('c.pdf', 11 * 1024 * 1024),
+    ]);
+
+    const uploaded = onFileUpload.mock.calls[onFileUpload.mock.calls.length - 1][0];
+    expect(uploaded.map((f) => f.name)).toEqual(['a.PDF']);
+    expect(screen.getByText(/1 file skipped: only \.pdf, \.docx, \.txt, \.csv files are supported/)).toBeInTheDocument();
+    expect(screen.getByText(/1 file exceeded the 10 MB limit/)).toBeInTheDocument();
+  });
+
+  test('clear removes the selection and the error', () => {
+    const onFileUpload = jest.fn();
+    render(<FileUpload onFileUpload={onFileUpload} />);
+
+    dropFiles([makeFile('a.pdf', 1024), makeFile('b.exe', 1024)]);
+    fireEvent.click(screen.getByText('Clear'));
+
+    expect(onFileUpload).toHaveBeenLastCalledWith([]);
+    expect(screen.queryByText(/files are supported/)).not.toBeInTheDocument();
+  });
+});
@@ -12,7 +12,7 @@ import argparse
 import csv
 import sys
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 
 try:
     import requests
@@ -30,45 +30,57 @@ def main():
     args = p.parse_args()
 
     url = args.base_url.rstrip("/") + "/api/metrics"
-    end_time = time.time() + args.duration * 60
-    rows = []
     headers = ["timestamp", "cpu_percent", "memory_rss_mb", "memory_vms_mb"]
 
-    print(f"Polling {url} every {args.interval}s for {args.duration} min... (Ctrl+C to stop early)", file=sys.stderr)
+    # Rows are written as they arrive so memory stays flat and Ctrl+C keeps what was collected
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    w = csv.DictWriter(out, fieldnames=headers)
+    w.writeheader()
+    out.flush()
+    count = 0
+    # One keep-alive session so every poll reuses the same connection instead of reconnecting
+    session = requests.Session()
 
-    while time.time() < end_time:
-        try:
-            r = requests.get(url, timeout=10)
-            r.raise_for_status()
-            data = r.json()
-            proc = data.get("process", {})
-            ts = datetime.utcnow().isoformat() + "Z"
-            row = {
-                "timestamp": ts,
-                "cpu_percent": proc.get("cpu_percent"),
-                "memory_rss_mb": proc.get("memory_rss_mb"),
-                "memory_vms_mb": proc.get("memory_vms_mb"),
-            }
-            rows.append(row)
-            print(f"{ts}  cpu={row['cpu_percent']}%  rss_mb={row['memory_rss_mb']}  vms_mb={row['memory_vms_mb']}", file=sys.stderr)
-        except requests.RequestException as e:
-            print(f"Request failed: {e}", file=sys.stderr)
-        except (KeyError, TypeError) as e:
-            print(f"Unexpected response: {e}", file=sys.stderr)
-        time.sleep(args.interval)
+    print(f"Polling {url} every {args.interval}s for {args.duration} min... (Ctrl+C to stop early)", file=sys.stderr)
 
-    if args.output and rows:
-        with open(args.output, "w", newline="") as f:
-            w = csv.DictWriter(f, fieldnames=headers)
-            w.writeheader()
-            w.writerows(rows)
-        print(f"Wrote {len(rows)} rows to {args.output}", file=sys.stderr)
-    elif rows:
-        print("\nSample CSV (paste into a file if needed):", file=sys.stderr)
-        out = sys.stdout
-        w = csv.DictWriter(out, fieldnames=headers)
-        w.writeheader()
-        w.writerows(rows)
+    # Schedule polls on the monotonic clock so intervals don't drift with request time or clock changes
+    next_poll = time.monotonic()
+    end_time = next_poll + args.duration * 60
+    try:
+        while time.monotonic() < end_time:
+            try:
+                r = session.get(url, timeout=10)
+                r.raise_for_status()
+                data = r.json()
+                proc = data.get("process", {})
+                ts = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+                row = {
+                    "timestamp": ts,
+                    "cpu_percent": proc.get("cpu_percent"),
+                    "memory_rss_mb": proc.get("memory_rss_mb"),
+                    "memory_vms_mb": proc.get("memory_vms_mb"),
+                }
+                w.writerow(row)
+                out.flush()
+                count += 1
+                print(f"{ts}  cpu={row['cpu_percent']}%  rss_mb={row['memory_rss_mb']}  vms_mb={row['memory_vms_mb']}", file=sys.stderr)
+            except requests.RequestException as e:
+                print(f"Request failed: {e}", file=sys.stderr)
+            except (KeyError, TypeError) as e:
+                print(f"Unexpected response: {e}", file=sys.stderr)
+            next_poll += args.interval
+            now = time.monotonic()
+            # A slow request skips the slots it overran rather than firing them back to back
+            if next_poll < now:
+                next_poll = now
+            time.sleep(max(0, min(next_poll, end_time) - now))
+    except KeyboardInterrupt:
+        print("Stopped early.", file=sys.stderr)
+    finally:
+        session.close()
+        if args.output:
+            out.close()
+            print(f"Wrote {count} rows to {args.output}", file=sys.stderr)
 
 
 if __name__ == "__main__":